@@ -18,6 +18,7 @@ Example log output:
   22:13:29 | INFO     | [check_precipitation:a3f2] END [OK]
 """
 
+import functools
 import logging
 import os
 import uuid
@@ -27,8 +28,9 @@ from typing import List, Optional
 
 
 # Directory paths
+@functools.lru_cache(maxsize=1)
 def get_base_dir() -> Path:
-    """Get base directory path for discuss-for-specs."""
+    """Get base directory path for discuss-for-specs (home is looked up once)."""
     return Path.home() / ".vibe-x" / "discuss-for-specs"
 
 
@@ -56,6 +58,22 @@ def ensure_directories() -> None:
 # Logger configuration
 _logger: Optional[logging.Logger] = None
 
+# Log line format: full datetime for cross-day log analysis
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)-8s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Environment variable to raise the log level (e.g. INFO) and skip debug output
+LOG_LEVEL_ENV_VAR = "DISCUSS_HOOKS_LOG_LEVEL"
+
+
+def _get_log_level() -> int:
+    """Get configured log level (default: DEBUG)."""
+    level = logging.getLevelName(os.environ.get(LOG_LEVEL_ENV_VAR, "DEBUG").upper())
+    return level if isinstance(level, int) else logging.DEBUG
+
+
 # Current hook context (thread-local would be better, but hooks are single-threaded)
 _current_hook_name: str = "unknown"
 _current_exec_id: str = "0000"
@@ -82,7 +100,9 @@ def get_logger(name: str = "discuss-hooks") -> logging.Logger:
     
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(_get_log_level())
+    # Records stop here; root handlers (if any) would only re-format them
+    logger.propagate = False
     
     # Avoid adding handlers multiple times
     if logger.handlers:
@@ -96,12 +116,7 @@ def get_logger(name: str = "discuss-hooks") -> logging.Logger:
     # File handler - detailed logging
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
-    # Format: full datetime for cross-day log analysis
-    file_format = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(file_format)
+    file_handler.setFormatter(_LOG_FORMATTER)
     logger.addHandler(file_handler)
     
     # Don't add stream handler - hooks should not output to stderr
@@ -120,6 +135,8 @@ def _log(level: int, message: str) -> None:
         message: Log message
     """
     logger = get_logger()
+    if not logger.isEnabledFor(level):
+        return
     prefix = f"[{_current_hook_name}:{_current_exec_id}]"
     logger.log(level, f"{prefix} {message}")
 
@@ -152,7 +169,9 @@ def log_hook_start(hook_name: str, input_data: dict = None) -> None:
         if file_path:
             _log(logging.INFO, f"target={file_path}")
         
-        # Log full input data at debug level
+        # Log full input data at debug level (skip serializing when disabled)
+        if not get_logger().isEnabledFor(logging.DEBUG):
+            return
         import json
         input_str = json.dumps(input_data, ensure_ascii=False)
         if len(input_str) > 500:
@@ -180,7 +199,7 @@ def log_hook_end(hook_name: str, output_data: dict = None, success: bool = True)
     status = "[OK]" if success else "[FAIL]"
     _log(logging.INFO, f"END {status}")
     
-    if output_data:
+    if output_data and get_logger().isEnabledFor(logging.DEBUG):
         import json
         output_str = json.dumps(output_data, ensure_ascii=False)
         if len(output_str) > 500:
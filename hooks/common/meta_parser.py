@@ -8,16 +8,23 @@ with old discussion directories that may still have meta.yaml files.
 For new code, use snapshot_manager.py instead.
 """
 
+import copy
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-import yaml
+
+# Parsed meta.yaml cache: path -> (mtime_ns, size, data)
+# Hooks are short-lived processes, so an in-process cache is safe.
+_META_CACHE: Dict[str, Tuple[int, int, Any]] = {}
 
 
 def load_meta(discuss_path: str) -> Optional[Dict[str, Any]]:
     """
     Load meta.yaml from discussion directory (backward compatibility only).
     
+    Parsed results are cached per process, keyed by (mtime_ns, size), so
+    repeated loads of an unchanged file skip YAML parsing.
+    
     Args:
         discuss_path: Path to discussion directory
         
@@ -26,11 +33,28 @@ def load_meta(discuss_path: str) -> Optional[Dict[str, Any]]:
     """
     meta_path = Path(discuss_path) / "meta.yaml"
     
-    if not meta_path.exists():
+    try:
+        st = meta_path.stat()
+    except OSError:
+        return None
+    
+    # An empty file parses to None anyway; skip the YAML import and parser
+    if st.st_size == 0:
         return None
     
     try:
-        with open(meta_path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        cache_key = str(meta_path)
+        cached = _META_CACHE.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+        
+        # Imported lazily: hooks that never touch meta.yaml skip the PyYAML import
+        import yaml
+        
+        # Prefer the libyaml-backed loader when available (pure-Python fallback otherwise)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(meta_path.read_bytes(), Loader=loader)
+        _META_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
     except Exception:
         return None
@@ -19,6 +19,24 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+# Allow output is constant, so serialize it once
+_ALLOW_OUTPUT = json.dumps({})
+
+# Block output per platform; %s is the JSON-encoded message. Matches what
+# json.dumps produces for the equivalent dict, byte for byte.
+_BLOCK_TEMPLATES = {
+    # Cursor uses followup_message
+    Platform.CURSOR: '{"followup_message": %s}',
+    # Claude Code uses decision: block with reason
+    Platform.CLAUDE_CODE: '{"decision": "block", "reason": %s}',
+}
+# Unknown platform, use generic format
+_BLOCK_TEMPLATE_GENERIC = '{"message": %s}'
+
+# Top-level keys that identify Claude Code input (checked after the Cursor rules)
+_CLAUDE_CODE_KEYS = frozenset(("tool_name", "hook_event_name"))
+
+
 def read_stdin_json() -> Optional[Dict[str, Any]]:
     """
     Read and parse JSON input from stdin.
@@ -27,11 +45,13 @@ def read_stdin_json() -> Optional[Dict[str, Any]]:
         Parsed JSON dictionary, or None if input is empty or invalid
     """
     try:
-        input_text = sys.stdin.read().strip()
-        if not input_text:
+        # Read raw bytes: json.loads detects UTF-8 itself, skipping a text decode
+        raw = sys.stdin.buffer.read()
+        if not raw.strip():
             return None
-        return json.loads(input_text)
-    except json.JSONDecodeError:
+        return json.loads(raw)
+    except ValueError:
+        # JSONDecodeError and UnicodeDecodeError are both ValueError subclasses
         return None
 
 
@@ -45,23 +65,26 @@ def detect_platform(input_data: Dict[str, Any]) -> Platform:
     Returns:
         Detected platform enum
     """
-    if input_data is None:
+    if not input_data:
         return Platform.UNKNOWN
     
+    keys = input_data.keys()
+    
     # Cursor: has cursor_version field (most reliable indicator)
-    if "cursor_version" in input_data:
+    if "cursor_version" in keys:
         return Platform.CURSOR
     
     # Cursor: has file_path at top level for afterFileEdit (without tool_input)
-    if "file_path" in input_data and "tool_input" not in input_data:
+    if "file_path" in keys and "tool_input" not in keys:
         return Platform.CURSOR
     
     # Cursor: stop hook has status field with "completed"
-    if "status" in input_data and "completed" in str(input_data.get("status", "")):
+    status = input_data.get("status")
+    if isinstance(status, str) and "completed" in status:
         return Platform.CURSOR
     
     # Claude Code: has tool_name or hook_event_name (but not cursor_version)
-    if "tool_name" in input_data or "hook_event_name" in input_data:
+    if not keys.isdisjoint(_CLAUDE_CODE_KEYS):
         return Platform.CLAUDE_CODE
     
     return Platform.UNKNOWN
@@ -118,7 +141,7 @@ def format_output_allow() -> str:
     Returns:
         JSON string for allow/pass output
     """
-    return json.dumps({})
+    return _ALLOW_OUTPUT
 
 
 def format_output_block(message: str, platform: Platform) -> str:
@@ -132,18 +155,8 @@ def format_output_block(message: str, platform: Platform) -> str:
     Returns:
         JSON string for block output
     """
-    if platform == Platform.CURSOR:
-        # Cursor uses followup_message
-        return json.dumps({"followup_message": message})
-    elif platform == Platform.CLAUDE_CODE:
-        # Claude Code uses decision: block with reason
-        return json.dumps({
-            "decision": "block",
-            "reason": message
-        })
-    else:
-        # Unknown platform, use generic format
-        return json.dumps({"message": message})
+    # Only the message needs encoding; the wrapper object is a fixed template
+    return _BLOCK_TEMPLATES.get(platform, _BLOCK_TEMPLATE_GENERIC) % json.dumps(message)
 
 
 def write_output(output: str) -> None:
@@ -153,7 +166,15 @@ def write_output(output: str) -> None:
     Args:
         output: JSON string to output
     """
-    print(output)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. StringIO)
+        print(output)
+        return
+    
+    # Single binary write: the hook emits exactly one JSON line
+    buffer.write(output.encode("utf-8") + b"\n")
+    buffer.flush()
 
 
 def allow_and_exit() -> None:
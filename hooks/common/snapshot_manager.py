@@ -14,7 +14,9 @@ Snapshot File Structure:
         "2026-01-30/multi-agent-platform-support": {
             "outline": {
                 "mtime": 1706621400.0,
-                "change_count": 2
+                "change_count": 2,
+                "size": 1532,
+                "hash": "9f86d081884c7d659a2feaa0c55ad015"
             },
             "decisions": [
                 {"name": "D01-xxx.md", "mtime": 1706620000.0}
@@ -27,18 +29,18 @@ Snapshot File Structure:
 }
 
 Core Logic:
-- outline mtime changed → change_count++
+- outline mtime changed → change_count++ (unless its content hash is unchanged)
 - decisions/notes changed → change_count = 0 (reset)
 - Trigger reminder when change_count >= threshold
 """
 
+import functools
+import hashlib
 import os
 import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from .logging_utils import log_debug, log_error, log_info, log_warning
 
@@ -52,6 +54,31 @@ SNAPSHOT_FILE_NAME = ".snapshot.yaml"
 # Detection window (hours)
 DETECTION_WINDOW_HOURS = 24
 
+# Outline content hash: BLAKE2b with a 16-byte digest (change detection only)
+HASH_DIGEST_SIZE = 16
+
+# Date directory name: YYYY-MM-DD
+DATE_DIR_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Last snapshot bytes read or written per path: path -> (mtime_ns, content)
+# Lets save_snapshot skip rewriting a file whose content would not change.
+_SNAPSHOT_CONTENT_CACHE: Dict[str, Tuple[int, bytes]] = {}
+
+
+def _get_yaml_codec():
+    """
+    Import PyYAML on first use, so hook runs that exit early never load it.
+    
+    Returns:
+        (yaml module, loader class, dumper class), preferring the libyaml
+        C implementations when available
+    """
+    import yaml
+    
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
 
 def get_snapshot_path(discuss_root: Path) -> Path:
     """
@@ -83,20 +110,18 @@ def load_snapshot(discuss_root: Path) -> Dict[str, Any]:
         return create_default_snapshot()
     
     try:
-        with open(snapshot_path, encoding="utf-8") as f:
-            snapshot = yaml.safe_load(f) or {}
+        content = snapshot_path.read_bytes()
+        _remember_snapshot_content(snapshot_path, content)
+        yaml, loader, _ = _get_yaml_codec()
+        snapshot = yaml.load(content, Loader=loader) or {}
         
         # Ensure structure
-        if "version" not in snapshot:
-            snapshot["version"] = 1
-        if "config" not in snapshot:
-            snapshot["config"] = {}
-        if "discussions" not in snapshot:
-            snapshot["discussions"] = {}
+        snapshot.setdefault("version", 1)
+        config = snapshot.setdefault("config", {})
+        snapshot.setdefault("discussions", {})
         
         # Ensure config has stale_threshold
-        if "stale_threshold" not in snapshot["config"]:
-            snapshot["config"]["stale_threshold"] = DEFAULT_STALE_THRESHOLD
+        config.setdefault("stale_threshold", DEFAULT_STALE_THRESHOLD)
         
         log_debug(f"Loaded snapshot with {len(snapshot.get('discussions', {}))} discussions")
         return snapshot
@@ -110,6 +135,9 @@ def save_snapshot(discuss_root: Path, snapshot: Dict[str, Any]) -> bool:
     """
     Save snapshot.yaml to .discuss directory.
     
+    The write is skipped when the serialized content matches what this
+    process last read from or wrote to the (unchanged) file.
+    
     Args:
         discuss_root: Path to .discuss directory
         snapshot: Snapshot dictionary
@@ -120,11 +148,30 @@ def save_snapshot(discuss_root: Path, snapshot: Dict[str, Any]) -> bool:
     snapshot_path = get_snapshot_path(discuss_root)
     
     try:
+        yaml, _, dumper = _get_yaml_codec()
+        content = yaml.dump(
+            snapshot, Dumper=dumper,
+            sort_keys=False, allow_unicode=True, default_flow_style=False,
+        ).encode("utf-8")
+        
+        if _snapshot_content_unchanged(snapshot_path, content):
+            log_debug(f"Snapshot unchanged, skipping save: {snapshot_path}")
+            return True
+        
         # Ensure .discuss directory exists
         discuss_root.mkdir(parents=True, exist_ok=True)
         
-        with open(snapshot_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(snapshot, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+        # Write to a temp file and rename, so a crash never leaves a torn snapshot.
+        # The temp name is per-process so concurrent hooks don't share it; no
+        # fsync, since the snapshot is best-effort state that can be rebuilt.
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, snapshot_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _remember_snapshot_content(snapshot_path, content)
         
         log_debug(f"Saved snapshot: {snapshot_path}")
         return True
@@ -134,6 +181,27 @@ def save_snapshot(discuss_root: Path, snapshot: Dict[str, Any]) -> bool:
         return False
 
 
+def _remember_snapshot_content(snapshot_path: Path, content: bytes) -> None:
+    """Record the on-disk content of a snapshot file along with its mtime."""
+    try:
+        mtime_ns = snapshot_path.stat().st_mtime_ns
+    except OSError:
+        return
+    _SNAPSHOT_CONTENT_CACHE[str(snapshot_path)] = (mtime_ns, content)
+
+
+def _snapshot_content_unchanged(snapshot_path: Path, content: bytes) -> bool:
+    """Check whether the snapshot file already holds exactly this content."""
+    cached = _SNAPSHOT_CONTENT_CACHE.get(str(snapshot_path))
+    if cached is None or cached[1] != content:
+        return False
+    try:
+        # File must not have been touched since we last read/wrote it
+        return snapshot_path.stat().st_mtime_ns == cached[0]
+    except OSError:
+        return False
+
+
 def create_default_snapshot() -> Dict[str, Any]:
     """
     Create default snapshot structure.
@@ -163,12 +231,29 @@ def get_discuss_key(discuss_dir: Path, discuss_root: Path) -> str:
     Returns:
         Discussion key string
     """
+    # Keys are requested several times per run for the same directories
+    return _get_discuss_key_cached(str(discuss_dir), str(discuss_root))
+
+
+@functools.lru_cache(maxsize=512)
+def _get_discuss_key_cached(discuss_dir: str, discuss_root: str) -> str:
+    """
+    Compute a discussion key from path strings (memoized).
+    
+    Args:
+        discuss_dir: Discussion directory path string
+        discuss_root: .discuss root directory path string
+        
+    Returns:
+        Discussion key string
+    """
+    discuss_path = Path(discuss_dir)
     try:
-        relative_path = discuss_dir.relative_to(discuss_root)
+        relative_path = discuss_path.relative_to(discuss_root)
         return str(relative_path).replace("\\", "/")  # Normalize path separators
     except ValueError:
         # Fallback: use directory name
-        return discuss_dir.name
+        return discuss_path.name
 
 
 def find_active_discussions(discuss_root: Path, hours: int = DETECTION_WINDOW_HOURS) -> List[Path]:
@@ -182,75 +267,130 @@ def find_active_discussions(discuss_root: Path, hours: int = DETECTION_WINDOW_HO
     Returns:
         List of discussion directory paths
     """
-    if not discuss_root.exists():
-        return []
-    
     active_discussions = []
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+    # Compare raw st_mtime floats against a precomputed POSIX timestamp
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
     
     # Scan .discuss directory for date directories (YYYY-MM-DD)
-    for date_dir in discuss_root.iterdir():
-        if not date_dir.is_dir():
-            continue
-        
-        # Check if directory name matches date pattern
-        if not re.match(r"\d{4}-\d{2}-\d{2}$", date_dir.name):
+    try:
+        with os.scandir(discuss_root) as date_entries:
+            date_dirs = [
+                entry.path for entry in date_entries
+                if DATE_DIR_PATTERN.fullmatch(entry.name) and entry.is_dir()
+            ]
+    except OSError:
+        return []
+    
+    for date_dir in date_dirs:
+        # Scan topic directories within date directory
+        try:
+            with os.scandir(date_dir) as topic_entries:
+                topic_dirs = [Path(entry.path) for entry in topic_entries if entry.is_dir()]
+        except OSError:
             continue
         
-        # Scan topic directories within date directory
-        for topic_dir in date_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
-            
+        for topic_dir in topic_dirs:
             # Check if any file in the discussion directory was modified recently
-            if is_recently_modified(topic_dir, cutoff_time):
+            if is_recently_modified(topic_dir, cutoff_ts):
                 active_discussions.append(topic_dir)
                 log_debug(f"Found active discussion: {get_discuss_key(topic_dir, discuss_root)}")
     
     return active_discussions
 
 
-def is_recently_modified(directory: Path, cutoff_time: datetime) -> bool:
+def is_recently_modified(
+    directory: Path,
+    cutoff_time: Union[datetime, float],
+    fast_check: bool = True
+) -> bool:
     """
     Check if directory or any file within it was modified after cutoff_time.
     
+    With fast_check, only the files scan_discussion tracks are checked
+    (outline.md, decisions/*.md, notes/*.md) instead of walking the whole
+    tree. Directory mtimes alone are not enough: in-place file writes do
+    not bump the parent directory's mtime.
+    
     Args:
         directory: Directory to check
-        cutoff_time: Cutoff time
+        cutoff_time: Cutoff as datetime or POSIX timestamp
+        fast_check: Only check tracked discussion files (default: True)
         
     Returns:
         True if recently modified
     """
+    if isinstance(cutoff_time, datetime):
+        cutoff_time = cutoff_time.timestamp()
+    
     # Check directory itself
     try:
-        dir_mtime = datetime.fromtimestamp(directory.stat().st_mtime, tz=timezone.utc)
-        if dir_mtime > cutoff_time:
+        if directory.stat().st_mtime > cutoff_time:
             return True
-    except (OSError, ValueError):
+    except OSError:
         pass
     
-    # Check files recursively (limit depth to avoid performance issues)
-    try:
-        for item in directory.rglob("*"):
-            if item.is_file():
-                try:
-                    file_mtime = datetime.fromtimestamp(item.stat().st_mtime, tz=timezone.utc)
-                    if file_mtime > cutoff_time:
-                        return True
-                except (OSError, ValueError):
-                    continue
-    except (OSError, ValueError):
-        pass
+    if fast_check:
+        return _tracked_files_modified(directory, cutoff_time)
+    
+    # Check files recursively with os.scandir (DirEntry caches file type)
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file() and entry.stat().st_mtime > cutoff_time:
+                            return True
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    
+    return False
+
+
+def _tracked_files_modified(directory: Path, cutoff_ts: float) -> bool:
+    """
+    Check whether outline.md, decisions/*.md or notes/*.md changed after cutoff_ts.
+    
+    Args:
+        directory: Discussion directory
+        cutoff_ts: Cutoff as POSIX timestamp
+        
+    Returns:
+        True if any tracked file (or decisions/notes listing) is recent
+    """
+    # Stop at the first recent entry: an active discussion usually has a
+    # recent outline.md, so the decisions/notes listings are rarely needed
+    for name in ("outline.md", "decisions", "notes"):
+        try:
+            if (directory / name).stat().st_mtime > cutoff_ts:
+                return True
+        except OSError:
+            continue
+    
+    for subdir in ("decisions", "notes"):
+        if any(item["mtime"] > cutoff_ts for item in _scan_markdown_files(directory / subdir)):
+            return True
     
     return False
 
 
-def scan_discussion(discuss_dir: Path) -> Dict[str, Any]:
+def scan_discussion(
+    discuss_dir: Path,
+    old_state: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Scan discussion directory and return current state.
     
+    The outline's content hash is reused from old_state when its mtime and
+    size are unchanged, so outline.md is only read after it was touched.
+    
     Args:
         discuss_dir: Path to discussion directory
+        old_state: Previous state from snapshot (optional)
         
     Returns:
         State dictionary with outline, decisions, and notes
@@ -261,47 +401,88 @@ def scan_discussion(discuss_dir: Path) -> Dict[str, Any]:
         "notes": [],
     }
     
-    # Scan outline.md
+    # Scan outline.md (a single stat doubles as the existence check)
     outline_path = discuss_dir / "outline.md"
-    if outline_path.exists():
-        try:
-            state["outline"]["mtime"] = outline_path.stat().st_mtime
-        except OSError:
-            pass
-    
-    # Scan decisions directory
-    decisions_dir = discuss_dir / "decisions"
-    if decisions_dir.exists() and decisions_dir.is_dir():
-        for decision_file in decisions_dir.glob("*.md"):
-            try:
-                state["decisions"].append({
-                    "name": decision_file.name,
-                    "mtime": decision_file.stat().st_mtime,
-                })
-            except OSError:
-                continue
-    
-    # Scan notes directory
-    notes_dir = discuss_dir / "notes"
-    if notes_dir.exists() and notes_dir.is_dir():
-        for note_file in notes_dir.glob("*.md"):
-            try:
-                state["notes"].append({
-                    "name": note_file.name,
-                    "mtime": note_file.stat().st_mtime,
-                })
-            except OSError:
-                continue
+    try:
+        outline_stat = outline_path.stat()
+    except OSError:
+        outline_stat = None
+    
+    if outline_stat is not None:
+        outline = state["outline"]
+        outline["mtime"] = outline_stat.st_mtime
+        outline["size"] = outline_stat.st_size
+        
+        old_outline = (old_state or {}).get("outline") or {}
+        if (old_outline.get("hash")
+                and old_outline.get("mtime") == outline_stat.st_mtime
+                and old_outline.get("size") == outline_stat.st_size):
+            outline["hash"] = old_outline["hash"]
+        else:
+            outline["hash"] = _hash_file(outline_path)
+    
+    # Scan decisions and notes directories
+    state["decisions"] = _scan_markdown_files(discuss_dir / "decisions")
+    state["notes"] = _scan_markdown_files(discuss_dir / "notes")
     
     return state
 
 
+def _hash_file(path: Path) -> Optional[str]:
+    """
+    Hash file content for change detection.
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest, or None if the file can't be read
+    """
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=HASH_DIGEST_SIZE).hexdigest()
+    except OSError:
+        return None
+
+
+def _scan_markdown_files(directory: Path) -> List[Dict[str, Any]]:
+    """
+    List *.md files in a directory with their mtimes.
+    
+    Uses os.scandir so file type comes from the directory entry and each
+    file needs at most one stat call.
+    
+    Args:
+        directory: Directory to scan (missing directory yields empty list)
+        
+    Returns:
+        List of {"name", "mtime"} dictionaries
+    """
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    files.append({
+                        "name": entry.name,
+                        "mtime": entry.stat().st_mtime,
+                    })
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files
+
+
 def compare_and_update(old_state: Dict[str, Any], new_state: Dict[str, Any]) -> int:
     """
     Compare old and new state, update change_count logic.
     
     Logic:
-    - If outline mtime increased → change_count++
+    - If outline mtime increased → change_count++ (unless its hash is unchanged)
     - If decisions/notes changed (added/modified/deleted) → change_count = 0 (reset)
     - If outline mtime decreased → don't increase (conservative handling)
     
@@ -317,14 +498,13 @@ def compare_and_update(old_state: Dict[str, Any], new_state: Dict[str, Any]) ->
     old_outline_mtime = old_state.get("outline", {}).get("mtime", 0.0)
     new_outline_mtime = new_state.get("outline", {}).get("mtime", 0.0)
     
-    # Check if decisions/notes changed
-    old_decisions = _normalize_file_list(old_state.get("decisions", []))
-    new_decisions = _normalize_file_list(new_state.get("decisions", []))
-    old_notes = _normalize_file_list(old_state.get("notes", []))
-    new_notes = _normalize_file_list(new_state.get("notes", []))
-    
-    decisions_changed = old_decisions != new_decisions
-    notes_changed = old_notes != new_notes
+    # Check if decisions/notes changed (common case: both sides empty, skip normalizing)
+    decisions_changed = _file_list_changed(
+        old_state.get("decisions") or [], new_state.get("decisions") or []
+    )
+    notes_changed = _file_list_changed(
+        old_state.get("notes") or [], new_state.get("notes") or []
+    )
     
     # If decisions or notes changed, reset change_count
     if decisions_changed or notes_changed:
@@ -333,7 +513,15 @@ def compare_and_update(old_state: Dict[str, Any], new_state: Dict[str, Any]) ->
         return 0
     
     # Check outline mtime change
-    if new_outline_mtime > old_outline_mtime:
+    old_outline_hash = old_state.get("outline", {}).get("hash")
+    if new_outline_mtime > old_outline_mtime and old_outline_hash and (
+        old_outline_hash == new_state.get("outline", {}).get("hash")
+    ):
+        # Outline touched (checkout, restore) but content unchanged
+        log_debug(f"Outline touched without content change, keeping change_count: {old_change_count}")
+        new_state["outline"]["change_count"] = old_change_count
+        return old_change_count
+    elif new_outline_mtime > old_outline_mtime:
         # Outline was modified, increment change_count
         new_change_count = old_change_count + 1
         log_debug(f"Outline modified, change_count: {old_change_count} -> {new_change_count}")
@@ -350,22 +538,38 @@ def compare_and_update(old_state: Dict[str, Any], new_state: Dict[str, Any]) ->
         return old_change_count
 
 
-def _normalize_file_list(file_list: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
+def _file_list_changed(old_list: List[Dict[str, Any]], new_list: List[Dict[str, Any]]) -> bool:
     """
-    Normalize file list for comparison.
+    Check whether two file lists differ by name or mtime.
+    
+    Args:
+        old_list: File list from snapshot
+        new_list: File list from scan
+        
+    Returns:
+        True if the lists differ
+    """
+    if not old_list and not new_list:
+        return False
+    return _normalize_file_list(old_list) != _normalize_file_list(new_list)
+
+
+def _normalize_file_list(file_list: List[Dict[str, Any]]) -> FrozenSet[Tuple[str, float]]:
+    """
+    Normalize file list for order-independent comparison.
+    
+    File names are unique within a directory, so a set compares the same
+    as a sorted list without the sort.
     
     Args:
         file_list: List of file dictionaries
         
     Returns:
-        List of (name, mtime) tuples
+        Frozenset of (name, mtime) tuples
     """
-    result = []
-    for item in file_list:
-        name = item.get("name", "")
-        mtime = item.get("mtime", 0.0)
-        result.append((name, mtime))
-    return sorted(result)
+    return frozenset(
+        (item.get("name", ""), item.get("mtime", 0.0)) for item in file_list
+    )
 
 
 def cleanup_deleted_discussions(snapshot: Dict[str, Any], discuss_root: Path) -> int:
@@ -381,12 +585,13 @@ def cleanup_deleted_discussions(snapshot: Dict[str, Any], discuss_root: Path) ->
     """
     discussions = snapshot.get("discussions", {})
     cleaned = 0
+    # Topic directory names per date directory, listed once per date
+    topics_by_date: Dict[str, FrozenSet[str]] = {}
     
     for key in list(discussions.keys()):
         # Reconstruct path from key
         try:
-            discuss_path = discuss_root / key
-            if not discuss_path.exists() or not discuss_path.is_dir():
+            if not _discussion_exists(discuss_root, key, topics_by_date):
                 del discussions[key]
                 cleaned += 1
                 log_debug(f"Removed deleted discussion from snapshot: {key}")
@@ -400,3 +605,39 @@ def cleanup_deleted_discussions(snapshot: Dict[str, Any], discuss_root: Path) ->
         log_info(f"Cleaned up {cleaned} deleted discussion(s) from snapshot")
     
     return cleaned
+
+
+def _discussion_exists(
+    discuss_root: Path,
+    key: str,
+    topics_by_date: Dict[str, FrozenSet[str]]
+) -> bool:
+    """
+    Check whether the discussion directory for a snapshot key exists.
+    
+    Standard "YYYY-MM-DD/topic" keys are resolved against one cached
+    listing per date directory instead of a stat per key.
+    
+    Args:
+        discuss_root: Path to .discuss directory
+        key: Discussion key
+        topics_by_date: Cache of topic directory names per date directory
+        
+    Returns:
+        True if the discussion directory exists
+    """
+    date, sep, topic = key.partition("/")
+    if not (sep and topic and "/" not in topic and DATE_DIR_PATTERN.fullmatch(date)):
+        # Non-standard key: is_dir() is False for missing paths
+        return (discuss_root / key).is_dir()
+    
+    if date not in topics_by_date:
+        try:
+            with os.scandir(discuss_root / date) as entries:
+                topics_by_date[date] = frozenset(
+                    entry.name for entry in entries if entry.is_dir()
+                )
+        except OSError:
+            topics_by_date[date] = frozenset()
+    
+    return topic in topics_by_date[date]
@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import shutil
@@ -35,14 +36,14 @@ def detect_platform() -> Optional[str]:
     Returns:
         "claude" or "cursor" if detected, None otherwise
     """
-    home = get_home_dir()
+    home = os.fspath(get_home_dir())
     
-    # Check for Claude Code
-    if (home / ".claude").exists():
+    # Check for Claude Code (plain os.path: one stat, no Path objects)
+    if os.path.isdir(os.path.join(home, ".claude")):
         return "claude"
     
     # Check for Cursor
-    if (home / ".cursor").exists():
+    if os.path.isdir(os.path.join(home, ".cursor")):
         return "cursor"
     
     return None
@@ -50,21 +51,50 @@ def detect_platform() -> Optional[str]:
 
 def get_claude_settings_path() -> Path:
     """Get Claude Code settings.json path."""
-    return get_home_dir() / ".claude" / "settings.json"
+    return _home_path(get_home_dir(), ".claude", "settings.json")
 
 
 def get_cursor_hooks_path() -> Path:
     """Get Cursor hooks.json path."""
-    return get_home_dir() / ".cursor" / "hooks.json"
+    return _home_path(get_home_dir(), ".cursor", "hooks.json")
 
 
 def get_hooks_install_dir(platform: str) -> Path:
     """Get the directory to install hooks scripts."""
-    home = get_home_dir()
     if platform == "claude":
-        return home / ".claude" / "hooks" / "discuss"
+        return _home_path(get_home_dir(), ".claude", "hooks", "discuss")
     else:
-        return home / ".cursor" / "hooks" / "discuss"
+        return _home_path(get_home_dir(), ".cursor", "hooks", "discuss")
+
+
+@functools.lru_cache(maxsize=None)
+def _home_path(home: Path, *parts: str) -> Path:
+    """Join parts under home (memoized; home is part of the key, so no invalidation is needed)."""
+    return home.joinpath(*parts)
+
+
+def _copy_if_changed(src: Path, dst: Path) -> bool:
+    """
+    Copy a file unless the destination already matches by size and mtime.
+    
+    The source mtime is carried over so a later reinstall can skip the copy.
+    
+    Returns:
+        True if the file was copied
+    """
+    src_stat = src.stat()
+    try:
+        dst_stat = dst.stat()
+        if (dst_stat.st_size == src_stat.st_size
+                and dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
+    
+    # copyfile uses the zero-copy fast path (sendfile) where available
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
 
 
 def copy_hooks_to_install_dir(platform: str) -> Path:
@@ -82,11 +112,13 @@ def copy_hooks_to_install_dir(platform: str) -> Path:
     (install_dir / "stop").mkdir(exist_ok=True)
     
     # Copy common modules
-    for file in (HOOKS_DIR / "common").glob("*.py"):
-        shutil.copy(file, install_dir / "common" / file.name)
+    with os.scandir(HOOKS_DIR / "common") as entries:
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                _copy_if_changed(Path(entry.path), install_dir / "common" / entry.name)
     
     # Copy hook scripts
-    shutil.copy(CHECK_PRECIPITATION, install_dir / "stop" / "check_precipitation.py")
+    _copy_if_changed(CHECK_PRECIPITATION, install_dir / "stop" / "check_precipitation.py")
     
     # Make scripts executable
     (install_dir / "stop" / "check_precipitation.py").chmod(0o755)
@@ -94,6 +126,26 @@ def copy_hooks_to_install_dir(platform: str) -> Path:
     return install_dir
 
 
+def _is_discuss_command(entry) -> bool:
+    """Check whether a {"command": ...} hook entry runs a discuss hook."""
+    return isinstance(entry, dict) and "discuss" in str(entry.get("command", ""))
+
+
+def _is_claude_discuss_hook(group) -> bool:
+    """
+    Check whether a Claude Code settings.json hook group runs a discuss hook.
+    
+    Every command in the group is checked, so empty or multi-command groups
+    written by other tools are handled.
+    """
+    if not isinstance(group, dict):
+        return False
+    commands = group.get("hooks")
+    if not isinstance(commands, list):
+        return False
+    return any(_is_discuss_command(cmd) for cmd in commands)
+
+
 def install_claude_hooks() -> None:
     """Install hooks for Claude Code."""
     settings_path = get_claude_settings_path()
@@ -120,11 +172,7 @@ def install_claude_hooks() -> None:
     if "Stop" not in hooks:
         hooks["Stop"] = []
     
-    stop_hook_exists = any(
-        "discuss" in str(h.get("hooks", [{}])[0].get("command", ""))
-        for h in hooks["Stop"]
-        if isinstance(h, dict)
-    )
+    stop_hook_exists = any(_is_claude_discuss_hook(h) for h in hooks["Stop"])
     
     if not stop_hook_exists:
         hooks["Stop"].append({
@@ -136,9 +184,7 @@ def install_claude_hooks() -> None:
         })
     
     # Save settings
-    settings_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(settings_path, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2)
+    _write_json_atomic(settings_path, settings)
     
     print(f"✓ Claude Code hooks installed")
     print(f"  - Settings: {settings_path}")
@@ -167,11 +213,7 @@ def install_cursor_hooks() -> None:
     if "stop" not in hooks:
         hooks["stop"] = []
     
-    stop_hook_exists = any(
-        "discuss" in h.get("command", "")
-        for h in hooks["stop"]
-        if isinstance(h, dict)
-    )
+    stop_hook_exists = any(_is_discuss_command(h) for h in hooks["stop"])
     
     if not stop_hook_exists:
         hooks["stop"].append({
@@ -179,9 +221,7 @@ def install_cursor_hooks() -> None:
         })
     
     # Save hooks config
-    hooks_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(hooks_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    _write_json_atomic(hooks_path, config)
     
     print(f"✓ Cursor hooks installed")
     print(f"  - Config: {hooks_path}")
@@ -202,13 +242,9 @@ def uninstall_claude_hooks() -> None:
         
         # Remove Stop hooks containing "discuss"
         if "Stop" in hooks:
-            hooks["Stop"] = [
-                h for h in hooks["Stop"]
-                if "discuss" not in str(h.get("hooks", [{}])[0].get("command", ""))
-            ]
+            hooks["Stop"] = _remove_claude_discuss_hooks(hooks["Stop"])
         
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        _write_json_atomic(settings_path, settings)
     
     # Remove installed hooks directory
     if install_dir.exists():
@@ -231,13 +267,9 @@ def uninstall_cursor_hooks() -> None:
         
         # Remove stop hooks containing "discuss"
         if "stop" in hooks:
-            hooks["stop"] = [
-                h for h in hooks["stop"]
-                if "discuss" not in h.get("command", "")
-            ]
+            hooks["stop"] = [h for h in hooks["stop"] if not _is_discuss_command(h)]
         
-        with open(hooks_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _write_json_atomic(hooks_path, config)
     
     # Remove installed hooks directory
     if install_dir.exists():
@@ -246,6 +278,56 @@ def uninstall_cursor_hooks() -> None:
     print("✓ Cursor hooks uninstalled")
 
 
+def _remove_claude_discuss_hooks(groups: list) -> list:
+    """
+    Remove discuss commands from Claude Code Stop hook groups.
+    
+    Only the matching commands are removed, so other tools' hooks sharing a
+    group survive; a group is dropped only when no commands remain in it.
+    
+    Args:
+        groups: Stop hook groups from settings.json
+        
+    Returns:
+        New list of hook groups
+    """
+    kept = []
+    for group in groups:
+        if not _is_claude_discuss_hook(group):
+            kept.append(group)
+            continue
+        commands = [cmd for cmd in group["hooks"] if not _is_discuss_command(cmd)]
+        if commands:
+            kept.append({**group, "hooks": commands})
+    return kept
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """
+    Write a JSON config file via a temp file and os.replace.
+    
+    An interrupted install can't leave a truncated settings file behind.
+    A symlinked config (e.g. from a dotfiles repo) is written through to
+    its target instead of being replaced by a regular file, and an existing
+    file keeps its permissions (settings.json may hold API keys).
+    """
+    if path.is_symlink():
+        path = path.resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Install discuss hooks")
@@ -36,9 +36,12 @@ Workflow:
 import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-# Add parent directory to path for common imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for common imports (once, if not already there)
+_HOOKS_ROOT = str(Path(__file__).parent.parent)
+if _HOOKS_ROOT not in sys.path:
+    sys.path.insert(0, _HOOKS_ROOT)
 
 from common.logging_utils import (  # noqa: E402
     log_action,
@@ -58,24 +61,30 @@ from common.platform_utils import (  # noqa: E402
     is_stop_hook_active,
     read_stdin_json,
 )
-from common.snapshot_manager import (  # noqa: E402
-    cleanup_deleted_discussions,
-    compare_and_update,
-    find_active_discussions,
-    get_discuss_key,
-    load_snapshot,
-    save_snapshot,
-    scan_discussion,
-)
 
 
 HOOK_NAME = "check_precipitation"
 
-
-from typing import Any, Optional
+# Fixed parts of the stale reminder message
+REMINDER_HEADER_FORCE = (
+    "## ⚠️ Precipitation Required\n\n"
+    "The discussion outline has been updated multiple times, but decisions/notes haven't been updated:\n\n"
+)
+REMINDER_HEADER_SUGGEST = (
+    "## 💡 Precipitation Suggestion\n\n"
+    "The discussion outline has been updated, but decisions/notes may need updating:\n\n"
+)
+REMINDER_FOOTER_FORCE = (
+    "\n**Please update the discussion files before continuing.**\n"
+    "This ensures important decisions are properly documented.\n"
+)
+REMINDER_FOOTER_SUGGEST = (
+    "\nWould you like me to help update the decisions/notes?\n"
+    "This helps maintain a complete record of our discussion.\n"
+)
 
 
-def get_workspace_root(input_data: Optional[dict[str, Any]] = None) -> Path:
+def get_workspace_root(input_data: Optional[Dict[str, Any]] = None) -> Path:
     """
     Get the workspace root directory using priority-based detection.
     
@@ -106,18 +115,17 @@ def get_workspace_root(input_data: Optional[dict[str, Any]] = None) -> Path:
                 return Path(workspace[0])
     
     # Priority 2: Platform-specific environment variables
-    for env_var in ["CURSOR_PROJECT_DIR", "CLAUDE_PROJECT_DIR"]:
-        if env_var in os.environ and os.environ[env_var]:
-            return Path(os.environ[env_var])
-    
     # Priority 3: Generic environment variables
-    for env_var in ["WORKSPACE_ROOT", "PROJECT_ROOT"]:
-        if env_var in os.environ and os.environ[env_var]:
-            return Path(os.environ[env_var])
-    
     # Priority 4: PWD
-    if "PWD" in os.environ and os.environ["PWD"]:
-        return Path(os.environ["PWD"])
+    env_root = (
+        os.environ.get("CURSOR_PROJECT_DIR")
+        or os.environ.get("CLAUDE_PROJECT_DIR")
+        or os.environ.get("WORKSPACE_ROOT")
+        or os.environ.get("PROJECT_ROOT")
+        or os.environ.get("PWD")
+    )
+    if env_root:
+        return Path(env_root)
     
     # Priority 5: Fallback to current working directory
     return Path.cwd()
@@ -141,26 +149,13 @@ def format_stale_reminder(
     Returns:
         Formatted reminder message
     """
-    if is_force:
-        header = "## ⚠️ Precipitation Required\n\n"
-        header += "The discussion outline has been updated multiple times, but decisions/notes haven't been updated:\n\n"
-    else:
-        header = "## 💡 Precipitation Suggestion\n\n"
-        header += "The discussion outline has been updated, but decisions/notes may need updating:\n\n"
-    
-    items_text = f"- Discussion: `{discuss_key}`\n"
-    items_text += f"- Outline changes without updates: {change_count} (threshold: {threshold})\n"
-    
-    footer = f"\n📁 Discussion: `.discuss/{discuss_key}`\n"
-    
-    if is_force:
-        footer += "\n**Please update the discussion files before continuing.**\n"
-        footer += "This ensures important decisions are properly documented.\n"
-    else:
-        footer += "\nWould you like me to help update the decisions/notes?\n"
-        footer += "This helps maintain a complete record of our discussion.\n"
-    
-    return header + items_text + footer
+    return "".join([
+        REMINDER_HEADER_FORCE if is_force else REMINDER_HEADER_SUGGEST,
+        f"- Discussion: `{discuss_key}`\n",
+        f"- Outline changes without updates: {change_count} (threshold: {threshold})\n",
+        f"\n📁 Discussion: `.discuss/{discuss_key}`\n",
+        REMINDER_FOOTER_FORCE if is_force else REMINDER_FOOTER_SUGGEST,
+    ])
 
 
 def main():
@@ -190,11 +185,23 @@ def main():
         # Get .discuss directory
         discuss_root = workspace_root / ".discuss"
         
-        if not discuss_root.exists():
+        # One stat; a stray file named .discuss is treated as "no discussions"
+        if not discuss_root.is_dir():
             log_skip("No .discuss directory found")
             log_hook_end(HOOK_NAME, {}, success=True)
             allow_and_exit()
         
+        # Imported only past the early exits above (no-op Stops skip it)
+        from common.snapshot_manager import (
+            cleanup_deleted_discussions,
+            compare_and_update,
+            find_active_discussions,
+            get_discuss_key,
+            load_snapshot,
+            save_snapshot,
+            scan_discussion,
+        )
+        
         log_action("Checking discussions for precipitation")
         
         # Load snapshot
@@ -213,24 +220,26 @@ def main():
         
         # Check each discussion for staleness
         stale_reminders = []
+        discussions = snapshot.setdefault("discussions", {})
+        snapshot_changed = False
         
         for discuss_dir in active_discussions:
             discuss_key = get_discuss_key(discuss_dir, discuss_root)
             log_debug(f"Checking discussion: {discuss_key}")
             
             # Get old state from snapshot
-            old_state = snapshot.get("discussions", {}).get(discuss_key, {})
+            old_state = discussions.get(discuss_key) or {}
             
             # Scan current state
-            new_state = scan_discussion(discuss_dir)
+            new_state = scan_discussion(discuss_dir, old_state)
             
             # Compare and update change_count
             change_count = compare_and_update(old_state, new_state)
             
             # Update snapshot with new state
-            if "discussions" not in snapshot:
-                snapshot["discussions"] = {}
-            snapshot["discussions"][discuss_key] = new_state
+            if new_state != old_state:
+                discussions[discuss_key] = new_state
+                snapshot_changed = True
             
             # Check if reminder is needed
             if change_count >= threshold:
@@ -244,20 +253,25 @@ def main():
                 )
         
         # Clean up deleted discussions
-        cleanup_deleted_discussions(snapshot, discuss_root)
+        if cleanup_deleted_discussions(snapshot, discuss_root):
+            snapshot_changed = True
         
-        # Save snapshot
-        save_snapshot(discuss_root, snapshot)
+        # Save snapshot (a Stop that changed nothing writes nothing)
+        if snapshot_changed:
+            save_snapshot(discuss_root, snapshot)
+        else:
+            log_debug("Snapshot unchanged, skipping save")
         
         # Summary logging
         log_info(f"Stale reminders: {len(stale_reminders)}")
         
         # If there are stale reminders, check if any require forcing
         if stale_reminders:
-            # Check if any reminder is force-level
-            has_force = any(is_force for _, is_force in stale_reminders)
+            # Split (reminder, is_force) pairs once; any force-level reminder forces
+            reminders, forces = zip(*stale_reminders)
+            has_force = any(forces)
             
-            combined_reminder = "\n\n---\n\n".join(reminder for reminder, _ in stale_reminders)
+            combined_reminder = "\n\n---\n\n".join(reminders)
             
             if has_force:
                 log_action(f"Blocking: {len(stale_reminders)} stale reminder(s) [FORCE]")
@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration.
+
+Makes the hook modules under hooks/ importable (common.*, install) once
+per session instead of in every test module.
+"""
+
+import sys
+from pathlib import Path
+
+_HOOKS_DIR = str(Path(__file__).parent.parent / "hooks")
+if _HOOKS_DIR not in sys.path:
+    sys.path.insert(0, _HOOKS_DIR)
@@ -3,10 +3,6 @@ Tests for hooks/common/file_utils.py
 """
 
 import pytest
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
 
 from common.file_utils import (
     ensure_directory,
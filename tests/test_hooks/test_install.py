@@ -6,13 +6,13 @@ NOTE: Since D01 decision, only stop hook is used (file-edit hook removed).
 
 import pytest
 import json
+import os
 import shutil
+import stat
 from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
 
 from install import (
+    CHECK_PRECIPITATION,
     get_home_dir,
     detect_platform,
     get_claude_settings_path,
@@ -23,9 +23,43 @@ from install import (
     install_cursor_hooks,
     uninstall_claude_hooks,
     uninstall_cursor_hooks,
+    _write_json_atomic,
 )
 
 
+def read_settings(path: Path) -> dict:
+    """Load a settings/hooks JSON file (bytes in, so no text decode step)."""
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def prebuilt_hooks_tree(tmp_path_factory):
+    """Copy the hooks tree once per session for install tests to link to."""
+    home = tmp_path_factory.mktemp("hooks_template")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("install.get_home_dir", lambda: home)
+        return copy_hooks_to_install_dir("claude")
+
+
+@pytest.fixture
+def linked_hooks_tree(prebuilt_hooks_tree, monkeypatch):
+    """Make install_*_hooks symlink the prebuilt tree instead of copying it."""
+    import install
+    
+    def link_hooks(platform):
+        dest = install.get_hooks_install_dir(platform)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not dest.exists():
+            try:
+                os.symlink(prebuilt_hooks_tree, dest, target_is_directory=True)
+            except OSError:
+                # e.g. Windows without symlink privilege
+                shutil.copytree(prebuilt_hooks_tree, dest)
+        return dest
+    
+    monkeypatch.setattr("install.copy_hooks_to_install_dir", link_hooks)
+
+
 class TestGetHomeDir:
     """Tests for get_home_dir function."""
     
@@ -134,12 +168,39 @@ class TestCopyHooksToInstallDir:
         # At least some common modules should exist
         common_dir = result / "common"
         assert any(common_dir.glob("*.py"))
+    
+    def test_reinstall_restores_modified_files(self, tmp_path, monkeypatch):
+        """Test that a locally modified installed file is overwritten."""
+        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+        
+        result = copy_hooks_to_install_dir("claude")
+        installed = result / "stop" / "check_precipitation.py"
+        installed.write_text("# modified")
+        
+        copy_hooks_to_install_dir("claude")
+        
+        assert installed.read_text() == CHECK_PRECIPITATION.read_text()
+    
+    def test_reinstall_skips_unchanged_files(self, tmp_path, monkeypatch):
+        """Test that unchanged installed files are not copied again."""
+        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+        
+        result = copy_hooks_to_install_dir("claude")
+        installed = result / "stop" / "check_precipitation.py"
+        
+        copied = []
+        monkeypatch.setattr("install.shutil.copyfile", lambda src, dst: copied.append(dst))
+        copy_hooks_to_install_dir("claude")
+        
+        assert copied == []
+        assert installed.read_text() == CHECK_PRECIPITATION.read_text()
 
 
+@pytest.mark.usefixtures("linked_hooks_tree")
 class TestInstallClaudeHooks:
     """Tests for install_claude_hooks function."""
     
-    def test_creates_settings(self, tmp_path, monkeypatch, capsys):
+    def test_creates_settings(self, tmp_path, monkeypatch):
         """Test creating new settings file."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
         (tmp_path / ".claude").mkdir()
@@ -149,11 +210,11 @@ class TestInstallClaudeHooks:
         settings_path = tmp_path / ".claude" / "settings.json"
         assert settings_path.exists()
         
-        settings = json.loads(settings_path.read_text())
+        settings = read_settings(settings_path)
         assert "hooks" in settings
         assert "Stop" in settings["hooks"]
     
-    def test_updates_existing_settings(self, tmp_path, monkeypatch, capsys):
+    def test_updates_existing_settings(self, tmp_path, monkeypatch):
         """Test updating existing settings file."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
         claude_dir = tmp_path / ".claude"
@@ -165,11 +226,11 @@ class TestInstallClaudeHooks:
         
         install_claude_hooks()
         
-        settings = json.loads((claude_dir / "settings.json").read_text())
+        settings = read_settings(claude_dir / "settings.json")
         assert settings["existingKey"] == "preserved"
         assert "hooks" in settings
     
-    def test_idempotent(self, tmp_path, monkeypatch, capsys):
+    def test_idempotent(self, tmp_path, monkeypatch):
         """Test that multiple installs don't duplicate hooks."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
         (tmp_path / ".claude").mkdir()
@@ -177,15 +238,61 @@ class TestInstallClaudeHooks:
         install_claude_hooks()
         install_claude_hooks()
         
-        settings = json.loads((tmp_path / ".claude" / "settings.json").read_text())
+        settings = read_settings(tmp_path / ".claude" / "settings.json")
         # Should only have one Stop hook
         assert len(settings["hooks"]["Stop"]) == 1
+    
+    def test_writes_through_symlinked_settings(self, tmp_path, monkeypatch):
+        """Test a symlinked settings.json is updated in place, with no temp files left."""
+        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        target = tmp_path / "dotfiles-settings.json"
+        target.write_text(json.dumps({"existingKey": "preserved"}))
+        (claude_dir / "settings.json").symlink_to(target)
+        
+        install_claude_hooks()
+        
+        assert (claude_dir / "settings.json").is_symlink()
+        settings = read_settings(target)
+        assert settings["existingKey"] == "preserved"
+        assert "Stop" in settings["hooks"]
+        assert not list(tmp_path.glob("*.tmp")) and not list(claude_dir.glob("*.tmp"))
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_keeps_settings_file_mode(self, tmp_path, monkeypatch):
+        """Test a private (0600) settings.json keeps its mode after install."""
+        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        settings_path = claude_dir / "settings.json"
+        settings_path.write_text(json.dumps({"env": {"API_KEY": "secret"}}))
+        settings_path.chmod(0o600)
+        
+        install_claude_hooks()
+        
+        assert stat.S_IMODE(settings_path.stat().st_mode) == 0o600
+    
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """Test a serialization error keeps the old file and removes the temp file."""
+        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        settings_path = claude_dir / "settings.json"
+        settings_path.write_text("{}")
+        
+        with pytest.raises(TypeError):
+            _write_json_atomic(settings_path, {"bad": object()})
+        
+        assert settings_path.read_text() == "{}"
+        assert not list(claude_dir.glob("*.tmp"))
 
 
+@pytest.mark.usefixtures("linked_hooks_tree")
 class TestInstallCursorHooks:
     """Tests for install_cursor_hooks function."""
     
-    def test_creates_hooks_json(self, tmp_path, monkeypatch, capsys):
+    def test_creates_hooks_json(self, tmp_path, monkeypatch):
         """Test creating new hooks.json file."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
         (tmp_path / ".cursor").mkdir()
@@ -195,11 +302,11 @@ class TestInstallCursorHooks:
         hooks_path = tmp_path / ".cursor" / "hooks.json"
         assert hooks_path.exists()
         
-        config = json.loads(hooks_path.read_text())
+        config = read_settings(hooks_path)
         assert "hooks" in config
         assert "stop" in config["hooks"]
     
-    def test_idempotent(self, tmp_path, monkeypatch, capsys):
+    def test_idempotent(self, tmp_path, monkeypatch):
         """Test that multiple installs don't duplicate hooks."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
         (tmp_path / ".cursor").mkdir()
@@ -207,40 +314,81 @@ class TestInstallCursorHooks:
         install_cursor_hooks()
         install_cursor_hooks()
         
-        config = json.loads((tmp_path / ".cursor" / "hooks.json").read_text())
+        config = read_settings(tmp_path / ".cursor" / "hooks.json")
         assert len(config["hooks"]["stop"]) == 1
 
 
+@pytest.fixture
+def installed_claude(tmp_path, monkeypatch):
+    """Install Claude Code hooks into a temporary home and return it."""
+    monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+    (tmp_path / ".claude").mkdir()
+    install_claude_hooks()
+    return tmp_path
+
+
+@pytest.fixture
+def installed_cursor(tmp_path, monkeypatch):
+    """Install Cursor hooks into a temporary home and return it."""
+    monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
+    (tmp_path / ".cursor").mkdir()
+    install_cursor_hooks()
+    return tmp_path
+
+
 class TestUninstallClaudeHooks:
     """Tests for uninstall_claude_hooks function."""
     
-    def test_removes_hooks_from_settings(self, tmp_path, monkeypatch, capsys):
+    def test_removes_hooks_from_settings(self, installed_claude):
         """Test removing hooks from settings."""
-        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
-        (tmp_path / ".claude").mkdir()
-        
-        # Install first
-        install_claude_hooks()
-        
         # Verify installed
-        settings = json.loads((tmp_path / ".claude" / "settings.json").read_text())
+        settings = read_settings(installed_claude / ".claude" / "settings.json")
         assert len(settings["hooks"]["Stop"]) > 0
         
         # Uninstall
         uninstall_claude_hooks()
         
         # Verify removed
-        settings = json.loads((tmp_path / ".claude" / "settings.json").read_text())
+        settings = read_settings(installed_claude / ".claude" / "settings.json")
         assert len(settings["hooks"]["Stop"]) == 0
     
-    def test_removes_install_directory(self, tmp_path, monkeypatch, capsys):
-        """Test removing installed hooks directory."""
+    def test_keeps_other_commands_in_mixed_group(self, installed_claude):
+        """Test only the discuss command is removed from a shared group."""
+        settings_path = installed_claude / ".claude" / "settings.json"
+        settings = read_settings(settings_path)
+        settings["hooks"]["Stop"][0]["hooks"].insert(
+            0, {"type": "command", "command": "my-linter --check"}
+        )
+        settings_path.write_text(json.dumps(settings))
+        
+        uninstall_claude_hooks()
+        
+        settings = read_settings(settings_path)
+        assert [group["hooks"] for group in settings["hooks"]["Stop"]] == [
+            [{"type": "command", "command": "my-linter --check"}]
+        ]
+    
+    def test_tolerates_foreign_hook_groups(self, tmp_path, monkeypatch):
+        """Test empty or non-discuss hook groups are kept and don't break install."""
         monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
-        (tmp_path / ".claude").mkdir()
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        foreign = [
+            {"matcher": "", "hooks": []},
+            {"matcher": "", "hooks": [{"type": "command", "command": "echo other"}]},
+        ]
+        (claude_dir / "settings.json").write_text(json.dumps({"hooks": {"Stop": foreign}}))
         
         install_claude_hooks()
-        install_dir = tmp_path / ".claude" / "hooks" / "discuss"
-        assert install_dir.exists()
+        uninstall_claude_hooks()
+        
+        settings = read_settings(claude_dir / "settings.json")
+        assert settings["hooks"]["Stop"] == foreign
+    
+    def test_removes_install_directory(self, installed_claude):
+        """Test removing installed hooks directory."""
+        install_dir = installed_claude / ".claude" / "hooks" / "discuss"
+        assert install_dir.is_dir() and not install_dir.is_symlink()
         
         uninstall_claude_hooks()
         assert not install_dir.exists()
@@ -249,25 +397,17 @@ class TestUninstallClaudeHooks:
 class TestUninstallCursorHooks:
     """Tests for uninstall_cursor_hooks function."""
     
-    def test_removes_hooks_from_config(self, tmp_path, monkeypatch, capsys):
+    def test_removes_hooks_from_config(self, installed_cursor):
         """Test removing hooks from config."""
-        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
-        (tmp_path / ".cursor").mkdir()
-        
-        install_cursor_hooks()
         uninstall_cursor_hooks()
         
-        config = json.loads((tmp_path / ".cursor" / "hooks.json").read_text())
+        config = read_settings(installed_cursor / ".cursor" / "hooks.json")
         assert len(config["hooks"]["stop"]) == 0
     
-    def test_removes_install_directory(self, tmp_path, monkeypatch, capsys):
+    def test_removes_install_directory(self, installed_cursor):
         """Test removing installed hooks directory."""
-        monkeypatch.setattr("install.get_home_dir", lambda: tmp_path)
-        (tmp_path / ".cursor").mkdir()
-        
-        install_cursor_hooks()
-        install_dir = tmp_path / ".cursor" / "hooks" / "discuss"
-        assert install_dir.exists()
+        install_dir = installed_cursor / ".cursor" / "hooks" / "discuss"
+        assert install_dir.is_dir() and not install_dir.is_symlink()
         
         uninstall_cursor_hooks()
         assert not install_dir.exists()
@@ -5,12 +5,9 @@ Tests for hooks/common/logging_utils.py
 import pytest
 import logging
 from pathlib import Path
-import sys
 import os
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
-
 from common.logging_utils import (
     get_base_dir,
     get_config_dir,
@@ -31,6 +28,30 @@ from common.logging_utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_logger(tmp_path, monkeypatch):
+    """Point Path.home() at tmp_path and drop the cached logger/base dir for each test."""
+    import common.logging_utils as logging_module
+    
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(logging_module, "_logger", None)
+    get_base_dir.cache_clear()
+    yield
+    get_base_dir.cache_clear()
+
+
+@pytest.fixture
+def null_log_handler(monkeypatch):
+    """Log to a NullHandler, for tests that only check logging doesn't raise."""
+    import common.logging_utils as logging_module
+    
+    monkeypatch.setattr(logging_module, "ensure_directories", lambda: None)
+    monkeypatch.setattr(logging, "FileHandler", lambda *args, **kwargs: logging.NullHandler())
+    # Start without handlers left on the shared logger by earlier tests
+    for name in ("discuss-hooks", "test"):
+        monkeypatch.setattr(logging.getLogger(name), "handlers", [])
+
+
 class TestDirectoryPaths:
     """Tests for directory path functions."""
     
@@ -53,16 +74,23 @@ class TestDirectoryPaths:
         """Test log directory path."""
         result = get_log_dir()
         assert result == Path.home() / ".discuss-for-specs" / "logs"
+    
+    def test_home_looked_up_once(self, tmp_path, monkeypatch):
+        """Test the base directory is computed once and reused."""
+        calls = []
+        monkeypatch.setattr(Path, "home", lambda: calls.append(1) or tmp_path)
+        
+        get_log_dir()
+        get_config_dir()
+        
+        assert len(calls) == 1
 
 
 class TestEnsureDirectories:
     """Tests for ensure_directories function."""
     
-    def test_creates_directories(self, tmp_path, monkeypatch):
+    def test_creates_directories(self, tmp_path):
         """Test that directories are created."""
-        # Mock Path.home() to return tmp_path
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
         ensure_directories()
         
         base_dir = tmp_path / ".discuss-for-specs"
@@ -72,144 +100,98 @@ class TestEnsureDirectories:
         assert log_dir.exists()
 
 
+@pytest.mark.usefixtures("null_log_handler")
 class TestGetLogger:
     """Tests for get_logger function."""
     
-    def test_returns_logger(self, tmp_path, monkeypatch):
+    def test_returns_logger(self):
         """Test logger creation."""
-        # Mock home directory
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        # Clear cached logger
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         logger = get_logger("test")
         
         assert logger is not None
         assert isinstance(logger, logging.Logger)
     
-    def test_returns_same_logger(self, tmp_path, monkeypatch):
+    def test_returns_same_logger(self):
         """Test logger caching."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         logger1 = get_logger("test")
         logger2 = get_logger("test")
         
         assert logger1 is logger2
+    
+    def test_no_propagation_with_existing_handler(self, monkeypatch):
+        """Test a logger that already has handlers still stops propagation."""
+        existing = logging.getLogger("test-preconfigured")
+        monkeypatch.setattr(existing, "handlers", [logging.NullHandler()])
+        monkeypatch.setattr(existing, "propagate", True)
+        
+        assert get_logger("test-preconfigured").propagate is False
+    
+    def test_log_level_from_env(self, monkeypatch):
+        """Test DISCUSS_HOOKS_LOG_LEVEL raises the logger level."""
+        monkeypatch.setenv("DISCUSS_HOOKS_LOG_LEVEL", "info")
+        
+        logger = get_logger("test")
+        try:
+            assert not logger.isEnabledFor(logging.DEBUG)
+            assert logger.isEnabledFor(logging.INFO)
+        finally:
+            logger.setLevel(logging.DEBUG)
 
 
+@pytest.mark.usefixtures("null_log_handler")
 class TestLogFunctions:
     """Tests for log helper functions."""
     
-    def test_log_hook_start(self, tmp_path, monkeypatch):
+    def test_log_hook_start(self):
         """Test hook start logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         # Should not raise
         log_hook_start("test_hook", {"key": "value"})
     
-    def test_log_hook_end(self, tmp_path, monkeypatch):
+    def test_log_hook_end(self):
         """Test hook end logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_hook_end("test_hook", {"result": "ok"}, success=True)
         log_hook_end("test_hook", {}, success=False)
     
-    def test_log_file_operation(self, tmp_path, monkeypatch):
+    def test_log_file_operation(self):
         """Test file operation logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_file_operation("EDIT", "/path/to/file.md", "File edited")
     
-    def test_log_discuss_detection(self, tmp_path, monkeypatch):
+    def test_log_discuss_detection(self):
         """Test discussion detection logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_discuss_detection("/project/.discuss/topic", "outline")
     
-    def test_log_meta_update(self, tmp_path, monkeypatch):
+    def test_log_meta_update(self):
         """Test meta update logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_meta_update("/path/to/discuss", {"current_round": 5})
     
-    def test_log_stale_detection(self, tmp_path, monkeypatch):
+    def test_log_stale_detection(self):
         """Test stale detection logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         stale_items = [("decisions", 5, False)]
         log_stale_detection("/path/to/discuss", stale_items)
     
-    def test_log_error(self, tmp_path, monkeypatch):
+    def test_log_error(self):
         """Test error logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_error("Test error message")
         log_error("Test error with exception", Exception("test"))
     
-    def test_log_warning(self, tmp_path, monkeypatch):
+    def test_log_warning(self):
         """Test warning logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_warning("Test warning message")
     
-    def test_log_info(self, tmp_path, monkeypatch):
+    def test_log_info(self):
         """Test info logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_info("Test info message")
     
-    def test_log_debug(self, tmp_path, monkeypatch):
+    def test_log_debug(self):
         """Test debug logging."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         log_debug("Test debug message")
 
 
 class TestLogFileCreation:
     """Tests for log file creation."""
     
-    def test_creates_log_file(self, tmp_path, monkeypatch):
+    def test_creates_log_file(self, tmp_path):
         """Test that log file is created."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-        
-        import common.logging_utils as logging_module
-        logging_module._logger = None
-        
         # Log something to trigger file creation
         log_info("Test message")
         
@@ -6,40 +6,68 @@ Most functionality has moved to snapshot_manager.py (see D02 decision).
 """
 
 import pytest
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
 
 from common.meta_parser import load_meta
 
 
+@pytest.fixture(scope="class")
+def shared_tmp(tmp_path_factory):
+    """One directory per test class, for tests that only read from it."""
+    return tmp_path_factory.mktemp("meta_shared")
+
+
 class TestLoadMeta:
     """Tests for load_meta function (backward compatibility)."""
     
-    def test_load_meta_nonexistent(self, tmp_path):
+    def test_load_meta_nonexistent(self, shared_tmp):
         """Test loading from non-existent directory."""
-        result = load_meta(str(tmp_path / "nonexistent"))
+        result = load_meta(str(shared_tmp / "nonexistent"))
         assert result is None
     
-    def test_load_meta_no_file(self, tmp_path):
+    def test_load_meta_no_file(self, shared_tmp):
         """Test loading from directory without meta.yaml."""
-        result = load_meta(str(tmp_path))
+        result = load_meta(str(shared_tmp))
         assert result is None
     
     def test_load_meta_with_file(self, tmp_path):
         """Test loading from directory with meta.yaml."""
         import yaml
         
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         meta = {"current_round": 5, "test_key": "test_value"}
-        (tmp_path / "meta.yaml").write_text(yaml.dump(meta))
+        (tmp_path / "meta.yaml").write_text(yaml.dump(meta, Dumper=dumper))
         
         loaded = load_meta(str(tmp_path))
         assert loaded == meta
     
+    def test_load_meta_empty_file(self, tmp_path):
+        """Test that an empty meta.yaml loads as None."""
+        (tmp_path / "meta.yaml").write_bytes(b"")
+        
+        assert load_meta(str(tmp_path)) is None
+    
     def test_load_meta_invalid_yaml(self, tmp_path):
         """Test loading invalid yaml returns None."""
         (tmp_path / "meta.yaml").write_text("invalid: [yaml: content")
         
         result = load_meta(str(tmp_path))
         assert result is None
+    
+    def test_load_meta_cached_copy_is_independent(self, tmp_path):
+        """Test cached results are returned as independent copies."""
+        (tmp_path / "meta.yaml").write_text("current_round: 1\n")
+        
+        first = load_meta(str(tmp_path))
+        first["current_round"] = 99
+        
+        assert load_meta(str(tmp_path)) == {"current_round": 1}
+    
+    def test_load_meta_reloads_after_change(self, tmp_path):
+        """Test changed file content invalidates the cache."""
+        meta_file = tmp_path / "meta.yaml"
+        meta_file.write_text("current_round: 1\n")
+        assert load_meta(str(tmp_path)) == {"current_round": 1}
+        
+        meta_file.write_text("current_round: 22\n")
+        
+        assert load_meta(str(tmp_path)) == {"current_round": 22}
@@ -6,9 +6,6 @@ import json
 import pytest
 import sys
 from io import StringIO
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
 
 from common.platform_utils import (
     Platform,
@@ -17,6 +14,7 @@ from common.platform_utils import (
     is_stop_hook_active,
     format_output_allow,
     format_output_block,
+    write_output,
 )
 
 
@@ -197,3 +195,33 @@ class TestFormatOutput:
         parsed = json.loads(result)
         
         assert parsed["message"] == "Test message"
+    
+    def test_format_block_matches_json_dumps(self):
+        """Test block output is byte-identical to dumping the equivalent dict."""
+        message = 'Quote " %s \n ⚠️'
+        
+        assert format_output_block(message, Platform.CLAUDE_CODE) == json.dumps(
+            {"decision": "block", "reason": message}
+        )
+        assert format_output_block(message, Platform.CURSOR) == json.dumps(
+            {"followup_message": message}
+        )
+
+
+class TestWriteOutput:
+    """Tests for write_output function."""
+    
+    def test_writes_single_line(self, capsys):
+        """Test output is written as one newline-terminated line."""
+        write_output('{"message": "⚠️ ok"}')
+        
+        assert capsys.readouterr().out == '{"message": "⚠️ ok"}\n'
+    
+    def test_text_only_stdout(self, monkeypatch):
+        """Test fallback when stdout has no binary buffer."""
+        fake_stdout = StringIO()
+        monkeypatch.setattr(sys, "stdout", fake_stdout)
+        
+        write_output("{}")
+        
+        assert fake_stdout.getvalue() == "{}\n"
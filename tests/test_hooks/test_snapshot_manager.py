@@ -3,69 +3,75 @@ Tests for hooks/common/snapshot_manager.py
 """
 
 import pytest
-from pathlib import Path
+import os
 import time
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "hooks"))
-
 from common.snapshot_manager import (
     load_snapshot,
     save_snapshot,
     create_default_snapshot,
     get_discuss_key,
     find_active_discussions,
+    is_recently_modified,
     scan_discussion,
     compare_and_update,
     cleanup_deleted_discussions,
 )
 
 
+@pytest.fixture
+def discuss_root(tmp_path):
+    """Empty .discuss directory inside tmp_path."""
+    root = tmp_path / ".discuss"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture(scope="module")
+def default_snapshot():
+    """Default snapshot built once and only read by the tests below."""
+    return create_default_snapshot()
+
+
 class TestCreateDefaultSnapshot:
     """Tests for create_default_snapshot function."""
     
-    def test_has_required_fields(self):
+    def test_has_required_fields(self, default_snapshot):
         """Test default snapshot has all required fields."""
-        snapshot = create_default_snapshot()
-        
-        assert "version" in snapshot
-        assert "config" in snapshot
-        assert "discussions" in snapshot
+        assert default_snapshot.keys() >= {"version", "config", "discussions"}
     
-    def test_version_is_1(self):
+    def test_version_is_1(self, default_snapshot):
         """Test version is 1."""
-        snapshot = create_default_snapshot()
-        assert snapshot["version"] == 1
+        assert default_snapshot["version"] == 1
     
-    def test_config_has_stale_threshold(self):
+    def test_config_has_stale_threshold(self, default_snapshot):
         """Test config has default stale_threshold."""
-        snapshot = create_default_snapshot()
-        assert snapshot["config"]["stale_threshold"] == 3
+        assert default_snapshot["config"]["stale_threshold"] == 3
     
-    def test_discussions_empty(self):
+    def test_discussions_empty(self, default_snapshot):
         """Test discussions starts empty."""
+        assert default_snapshot["discussions"] == {}
+    
+    def test_returns_fresh_copy(self, default_snapshot):
+        """Test each call returns an independent dict."""
         snapshot = create_default_snapshot()
-        assert snapshot["discussions"] == {}
+        snapshot["discussions"]["x"] = {}
+        
+        assert default_snapshot["discussions"] == {}
 
 
 class TestLoadSaveSnapshot:
     """Tests for load_snapshot and save_snapshot functions."""
     
-    def test_load_nonexistent_returns_default(self, tmp_path):
+    def test_load_nonexistent_returns_default(self, discuss_root):
         """Test loading from non-existent directory returns default."""
-        discuss_root = tmp_path / ".discuss"
-        discuss_root.mkdir()
-        
         result = load_snapshot(discuss_root)
         
         assert result["version"] == 1
         assert result["discussions"] == {}
     
-    def test_save_and_load_snapshot(self, tmp_path):
+    def test_save_and_load_snapshot(self, discuss_root):
         """Test saving and loading snapshot."""
-        discuss_root = tmp_path / ".discuss"
-        discuss_root.mkdir()
-        
         snapshot = {
             "version": 1,
             "config": {"stale_threshold": 5},
@@ -82,22 +88,46 @@ class TestLoadSaveSnapshot:
         assert loaded["config"]["stale_threshold"] == 5
         assert "2026-01-30/topic" in loaded["discussions"]
     
-    def test_snapshot_file_location(self, tmp_path):
+    def test_snapshot_file_location(self, discuss_root):
         """Test snapshot is saved to .snapshot.yaml."""
-        discuss_root = tmp_path / ".discuss"
-        discuss_root.mkdir()
-        
         save_snapshot(discuss_root, create_default_snapshot())
         
         assert (discuss_root / ".snapshot.yaml").exists()
+    
+    def test_save_leaves_no_temp_file(self, discuss_root):
+        """Test atomic save does not leave a temp file behind."""
+        save_snapshot(discuss_root, create_default_snapshot())
+        save_snapshot(discuss_root, create_default_snapshot())
+        
+        assert [p.name for p in discuss_root.iterdir()] == [".snapshot.yaml"]
+    
+    def test_unchanged_snapshot_not_rewritten(self, discuss_root):
+        """Test saving identical content keeps the existing file."""
+        snapshot_file = discuss_root / ".snapshot.yaml"
+        
+        save_snapshot(discuss_root, create_default_snapshot())
+        inode = snapshot_file.stat().st_ino
+        
+        assert save_snapshot(discuss_root, load_snapshot(discuss_root)) is True
+        assert snapshot_file.stat().st_ino == inode
+    
+    def test_externally_modified_snapshot_rewritten(self, discuss_root):
+        """Test a file changed on disk since the last save is rewritten."""
+        snapshot_file = discuss_root / ".snapshot.yaml"
+        
+        save_snapshot(discuss_root, create_default_snapshot())
+        snapshot_file.write_text("version: 1\n")
+        
+        save_snapshot(discuss_root, create_default_snapshot())
+        
+        assert load_snapshot(discuss_root) == create_default_snapshot()
 
 
 class TestGetDiscussKey:
     """Tests for get_discuss_key function."""
     
-    def test_returns_relative_path(self, tmp_path):
+    def test_returns_relative_path(self, discuss_root):
         """Test returns relative path as key."""
-        discuss_root = tmp_path / ".discuss"
         discuss_dir = discuss_root / "2026-01-30" / "topic-name"
         discuss_dir.mkdir(parents=True)
         
@@ -109,18 +139,14 @@ class TestGetDiscussKey:
 class TestFindActiveDiscussions:
     """Tests for find_active_discussions function."""
     
-    def test_empty_directory(self, tmp_path):
+    def test_empty_directory(self, discuss_root):
         """Test with empty .discuss directory."""
-        discuss_root = tmp_path / ".discuss"
-        discuss_root.mkdir()
-        
         result = find_active_discussions(discuss_root)
         
         assert result == []
     
-    def test_finds_recently_modified(self, tmp_path):
+    def test_finds_recently_modified(self, discuss_root):
         """Test finds recently modified discussions."""
-        discuss_root = tmp_path / ".discuss"
         discuss_dir = discuss_root / "2026-01-30" / "topic"
         discuss_dir.mkdir(parents=True)
         (discuss_dir / "outline.md").write_text("# Outline")
@@ -129,6 +155,97 @@ class TestFindActiveDiscussions:
         
         assert len(result) == 1
         assert result[0] == discuss_dir
+    
+    def test_ignores_stale_discussions(self, discuss_root):
+        """Test skips discussions with no changes inside the window."""
+        discuss_dir = discuss_root / "2026-01-30" / "topic"
+        decisions_dir = discuss_dir / "decisions"
+        decisions_dir.mkdir(parents=True)
+        (decisions_dir / "D01-old.md").write_text("# Decision")
+        
+        old = time.time() - 48 * 3600
+        for path in (decisions_dir / "D01-old.md", decisions_dir, discuss_dir):
+            os.utime(path, (old, old))
+        
+        assert find_active_discussions(discuss_root) == []
+    
+    def test_finds_nested_recent_file(self, discuss_root):
+        """Test a recent file in a subdirectory marks the discussion active."""
+        discuss_dir = discuss_root / "2026-01-30" / "topic"
+        decisions_dir = discuss_dir / "decisions"
+        decisions_dir.mkdir(parents=True)
+        (decisions_dir / "D01-new.md").write_text("# Decision")
+        
+        old = time.time() - 48 * 3600
+        os.utime(discuss_dir, (old, old))
+        
+        assert find_active_discussions(discuss_root) == [discuss_dir]
+    
+    def test_many_date_directories(self, discuss_root):
+        """Test results across many date directories."""
+        expected = []
+        for day in range(1, 7):
+            discuss_dir = discuss_root / f"2026-01-{day:02d}" / "topic"
+            discuss_dir.mkdir(parents=True)
+            (discuss_dir / "outline.md").write_text("# Outline")
+            expected.append(discuss_dir)
+        
+        result = find_active_discussions(discuss_root)
+        
+        assert sorted(result) == expected
+    
+    def test_ignores_non_date_directories(self, discuss_root):
+        """Test only YYYY-MM-DD directories are scanned."""
+        (discuss_root / "archive" / "topic").mkdir(parents=True)
+        
+        assert find_active_discussions(discuss_root) == []
+
+
+class TestIsRecentlyModified:
+    """Tests for is_recently_modified function."""
+    
+    def test_fast_check_ignores_untracked_files(self, tmp_path):
+        """Test fast check only looks at outline/decisions/notes."""
+        from datetime import datetime, timedelta, timezone
+        
+        discuss_dir = tmp_path / "topic"
+        assets_dir = discuss_dir / "assets"
+        assets_dir.mkdir(parents=True)
+        (assets_dir / "diagram.png").write_bytes(b"png")
+        
+        old = time.time() - 48 * 3600
+        for path in (assets_dir, discuss_dir):
+            os.utime(path, (old, old))
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+        
+        assert is_recently_modified(discuss_dir, cutoff) is False
+        assert is_recently_modified(discuss_dir, cutoff, fast_check=False) is True
+    
+    def test_fast_check_detects_in_place_outline_edit(self, tmp_path):
+        """Test an outline edit is seen even when the directory mtime is old."""
+        from datetime import datetime, timedelta, timezone
+        
+        discuss_dir = tmp_path / "topic"
+        discuss_dir.mkdir()
+        (discuss_dir / "outline.md").write_text("# Outline")
+        
+        old = time.time() - 48 * 3600
+        os.utime(discuss_dir, (old, old))
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+        
+        assert is_recently_modified(discuss_dir, cutoff) is True
+
+
+@pytest.fixture(scope="class")
+def discussion_tree(tmp_path_factory):
+    """Discussion with an outline, one decision and one note (read-only, shared per class)."""
+    discuss_dir = tmp_path_factory.mktemp("topic")
+    (discuss_dir / "outline.md").write_text("# Outline")
+    (discuss_dir / "decisions").mkdir()
+    (discuss_dir / "decisions" / "D01-test.md").write_text("# Decision")
+    (discuss_dir / "notes").mkdir()
+    (discuss_dir / "notes" / "research.md").write_text("# Research")
+    return discuss_dir
 
 
 class TestScanDiscussion:
@@ -146,40 +263,85 @@ class TestScanDiscussion:
         assert result["decisions"] == []
         assert result["notes"] == []
     
-    def test_scans_outline(self, tmp_path):
+    def test_scans_outline(self, discussion_tree):
         """Test scanning outline.md."""
+        result = scan_discussion(discussion_tree)
+        
+        assert result["outline"]["mtime"] > 0
+    
+    def test_scans_decisions(self, discussion_tree):
+        """Test scanning decisions directory."""
+        result = scan_discussion(discussion_tree)
+        
+        assert len(result["decisions"]) == 1
+        assert result["decisions"][0]["name"] == "D01-test.md"
+    
+    def test_scans_notes(self, discussion_tree):
+        """Test scanning notes directory."""
+        result = scan_discussion(discussion_tree)
+        
+        assert len(result["notes"]) == 1
+        assert result["notes"][0]["name"] == "research.md"
+
+
+class TestOutlineContentHash:
+    """Tests for outline content hashing in scan_discussion/compare_and_update."""
+    
+    def test_touch_without_content_change_keeps_count(self, tmp_path):
+        """Test an mtime-only outline change does not increment change_count."""
         discuss_dir = tmp_path / "topic"
         discuss_dir.mkdir()
         outline = discuss_dir / "outline.md"
         outline.write_text("# Outline")
         
-        result = scan_discussion(discuss_dir)
+        old_state = scan_discussion(discuss_dir)
+        old_state["outline"]["change_count"] = 1
         
-        assert result["outline"]["mtime"] > 0
+        later = time.time() + 10
+        os.utime(outline, (later, later))
+        new_state = scan_discussion(discuss_dir, old_state)
+        
+        assert compare_and_update(old_state, new_state) == 1
     
-    def test_scans_decisions(self, tmp_path):
-        """Test scanning decisions directory."""
+    def test_content_change_increments_count(self, tmp_path):
+        """Test a real outline edit still increments change_count."""
         discuss_dir = tmp_path / "topic"
-        decisions_dir = discuss_dir / "decisions"
-        decisions_dir.mkdir(parents=True)
-        (decisions_dir / "D01-test.md").write_text("# Decision")
+        discuss_dir.mkdir()
+        outline = discuss_dir / "outline.md"
+        outline.write_text("# Outline")
         
-        result = scan_discussion(discuss_dir)
+        old_state = scan_discussion(discuss_dir)
         
-        assert len(result["decisions"]) == 1
-        assert result["decisions"][0]["name"] == "D01-test.md"
+        outline.write_text("# Outline v2")
+        later = time.time() + 10
+        os.utime(outline, (later, later))
+        new_state = scan_discussion(discuss_dir, old_state)
+        
+        assert new_state["outline"]["hash"] != old_state["outline"]["hash"]
+        assert compare_and_update(old_state, new_state) == 1
     
-    def test_scans_notes(self, tmp_path):
-        """Test scanning notes directory."""
+    def test_reuses_hash_when_unchanged(self, tmp_path, monkeypatch):
+        """Test outline isn't re-read when mtime and size match the snapshot."""
+        import common.snapshot_manager as snapshot_module
+        
         discuss_dir = tmp_path / "topic"
-        notes_dir = discuss_dir / "notes"
-        notes_dir.mkdir(parents=True)
-        (notes_dir / "research.md").write_text("# Research")
+        discuss_dir.mkdir()
+        (discuss_dir / "outline.md").write_text("# Outline")
+        old_state = scan_discussion(discuss_dir)
         
-        result = scan_discussion(discuss_dir)
+        monkeypatch.setattr(snapshot_module, "_hash_file", lambda path: pytest.fail("re-hashed"))
+        new_state = scan_discussion(discuss_dir, old_state)
         
-        assert len(result["notes"]) == 1
-        assert result["notes"][0]["name"] == "research.md"
+        assert new_state["outline"]["hash"] == old_state["outline"]["hash"]
+
+
+def _state(outline_mtime, change_count=0, decisions=None, notes=None):
+    """Build a discussion state dict as produced by scan_discussion."""
+    return {
+        "outline": {"mtime": outline_mtime, "change_count": change_count},
+        "decisions": decisions or [],
+        "notes": notes or [],
+    }
 
 
 class TestCompareAndUpdate:
@@ -200,87 +362,41 @@ class TestCompareAndUpdate:
         assert result == 1
         assert new_state["outline"]["change_count"] == 1
     
-    def test_outline_changed_increments_count(self):
-        """Test outline mtime change increments change_count."""
-        old_state = {
-            "outline": {"mtime": 100.0, "change_count": 1},
-            "decisions": [],
-            "notes": []
-        }
-        new_state = {
-            "outline": {"mtime": 200.0, "change_count": 0},
-            "decisions": [],
-            "notes": []
-        }
-        
-        result = compare_and_update(old_state, new_state)
-        
-        assert result == 2
-        assert new_state["outline"]["change_count"] == 2
-    
-    def test_decisions_changed_resets_count(self):
-        """Test decisions change resets change_count."""
-        old_state = {
-            "outline": {"mtime": 100.0, "change_count": 5},
-            "decisions": [],
-            "notes": []
-        }
-        new_state = {
-            "outline": {"mtime": 200.0, "change_count": 0},
-            "decisions": [{"name": "D01.md", "mtime": 200.0}],
-            "notes": []
-        }
-        
-        result = compare_and_update(old_state, new_state)
-        
-        assert result == 0
-        assert new_state["outline"]["change_count"] == 0
-    
-    def test_notes_changed_resets_count(self):
-        """Test notes change resets change_count."""
-        old_state = {
-            "outline": {"mtime": 100.0, "change_count": 3},
-            "decisions": [],
-            "notes": []
-        }
-        new_state = {
-            "outline": {"mtime": 200.0, "change_count": 0},
-            "decisions": [],
-            "notes": [{"name": "note.md", "mtime": 200.0}]
-        }
-        
-        result = compare_and_update(old_state, new_state)
-        
-        assert result == 0
-        assert new_state["outline"]["change_count"] == 0
-    
-    def test_no_change_preserves_count(self):
-        """Test no change preserves change_count."""
-        old_state = {
-            "outline": {"mtime": 100.0, "change_count": 2},
-            "decisions": [],
-            "notes": []
-        }
-        new_state = {
-            "outline": {"mtime": 100.0, "change_count": 0},
-            "decisions": [],
-            "notes": []
-        }
-        
+    @pytest.mark.parametrize("old_state, new_state, expected", [
+        pytest.param(
+            _state(100.0, change_count=1), _state(200.0), 2,
+            id="outline_changed_increments_count",
+        ),
+        pytest.param(
+            _state(100.0, change_count=5),
+            _state(200.0, decisions=[{"name": "D01.md", "mtime": 200.0}]),
+            0,
+            id="decisions_changed_resets_count",
+        ),
+        pytest.param(
+            _state(100.0, change_count=3),
+            _state(200.0, notes=[{"name": "note.md", "mtime": 200.0}]),
+            0,
+            id="notes_changed_resets_count",
+        ),
+        pytest.param(
+            _state(100.0, change_count=2), _state(100.0), 2,
+            id="no_change_preserves_count",
+        ),
+    ])
+    def test_change_count(self, old_state, new_state, expected):
+        """Test change_count after outline, decision and note changes."""
         result = compare_and_update(old_state, new_state)
         
-        assert result == 2
-        assert new_state["outline"]["change_count"] == 2
+        assert result == expected
+        assert new_state["outline"]["change_count"] == expected
 
 
 class TestCleanupDeletedDiscussions:
     """Tests for cleanup_deleted_discussions function."""
     
-    def test_removes_deleted_discussion(self, tmp_path):
+    def test_removes_deleted_discussion(self, discuss_root):
         """Test removes entry for deleted discussion."""
-        discuss_root = tmp_path / ".discuss"
-        discuss_root.mkdir()
-        
         snapshot = {
             "version": 1,
             "config": {},
@@ -296,9 +412,8 @@ class TestCleanupDeletedDiscussions:
         assert cleaned == 1
         assert "2026-01-30/deleted-topic" not in snapshot["discussions"]
     
-    def test_preserves_existing_discussion(self, tmp_path):
+    def test_preserves_existing_discussion(self, discuss_root):
         """Test preserves entry for existing discussion."""
-        discuss_root = tmp_path / ".discuss"
         discuss_dir = discuss_root / "2026-01-30" / "existing-topic"
         discuss_dir.mkdir(parents=True)
         
@@ -316,3 +431,24 @@ class TestCleanupDeletedDiscussions:
         
         assert cleaned == 0
         assert "2026-01-30/existing-topic" in snapshot["discussions"]
+    
+    def test_mixed_existing_and_deleted_same_date(self, discuss_root):
+        """Test only deleted topics are removed when they share a date."""
+        (discuss_root / "2026-01-30" / "kept").mkdir(parents=True)
+        (discuss_root / "2026-01-30" / "file-not-dir").write_text("")
+        
+        snapshot = {
+            "version": 1,
+            "config": {},
+            "discussions": {
+                "2026-01-30/kept": {},
+                "2026-01-30/gone": {},
+                "2026-01-30/file-not-dir": {},
+                "2026-01-31/gone": {},
+            }
+        }
+        
+        cleaned = cleanup_deleted_discussions(snapshot, discuss_root)
+        
+        assert cleaned == 3
+        assert list(snapshot["discussions"]) == ["2026-01-30/kept"]